@@ -8,6 +8,8 @@ Audio files are cached and only regenerated when narration text changes.
 Usage:
     python e2e/scripts/generate-narration.py behavior-verification
     python e2e/scripts/generate-narration.py --all
+    python e2e/scripts/generate-narration.py --all --threads 4
+    python e2e/scripts/generate-narration.py --compile
 
 Output:
     e2e/audio/<flow-id>/step-<n>.wav
@@ -16,10 +18,19 @@ Output:
 import os
 import sys
 import yaml
+import base64
+import functools
 import hashlib
 import json
+import mmap
+import pickle
 import subprocess
 import re
+import shutil
+import tempfile
+import wave
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 
 # Add the venv to path
@@ -29,12 +40,34 @@ VENV_SITE_PACKAGES = E2E_DIR / ".venv" / "lib" / "python3.11" / "site-packages"
 if VENV_SITE_PACKAGES.exists():
     sys.path.insert(0, str(VENV_SITE_PACKAGES))
 
-from mlx_audio.tts.generate import generate_audio
+# Optional accelerators - imported after the venv is on the path
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# LibYAML-backed loader is ~10x faster; fall back to pure Python if unavailable
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 # Paths
 SPECS_DIR = E2E_DIR / "specs"
 AUDIO_DIR = E2E_DIR / "audio"
 CACHE_FILE = AUDIO_DIR / ".narration-cache.json"
+COMPILED_SPECS_DIR = SPECS_DIR / ".compiled"
+
+# Cache key holding per-spec metadata (narration ids are always "<flow>/<name>")
+SPECS_CACHE_KEY = "_specs"
+
+# Caches at least this large are memory-mapped rather than read into a copy
+CACHE_MMAP_THRESHOLD = 10 * 1024 * 1024
 
 # TTS settings - Kokoro is the highest quality MLX-Audio model
 TTS_MODEL = "prince-canuma/Kokoro-82M"
@@ -42,29 +75,106 @@ TTS_VOICE = "af_heart"  # American Female - Heart
 TTS_SPEED = 1.1  # Slightly faster for natural flow
 TTS_LANG = "a"  # American English
 
+# Action types that get cue points
+_INTERACTIVE_TYPES = frozenset({"click", "fill"})
+
+# Narration phrases that may describe a click, in priority order
+_CLICK_TEMPLATES = ("taps the {0}", "clicks the {0}", "taps {0}", "clicks {0}", "click the {0}", "tap the {0}")
+_CONFIRM_PHRASES = ("confirms with a second tap", "confirms the action", "taps again", "second tap")
+
+# Minimum cue points before timestamp arithmetic switches to the Numba kernel
+JIT_MIN_CUE_POINTS = 64
+
+# Loaded lazily, once per process, by get_tts_model()
+_TTS_MODEL = None
+
+# Parallel synthesis - one process per worker (MLX is not thread-safe)
+DEFAULT_WORKERS = 3
+
+
+def _read_cache_json() -> dict:
+    """Parse the cache file, mapping it into memory when large enough to matter."""
+    if CACHE_FILE.stat().st_size >= CACHE_MMAP_THRESHOLD:
+        with open(CACHE_FILE, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            with memoryview(m) as view:
+                return orjson.loads(view)
+    return orjson.loads(CACHE_FILE.read_bytes())
+
 
 def load_cache() -> dict:
     """Load the narration cache file."""
-    if CACHE_FILE.exists():
-        with open(CACHE_FILE, "r") as f:
-            return json.load(f)
-    return {}
+    if not CACHE_FILE.exists():
+        return {}
+
+    if orjson is not None:
+        try:
+            return _read_cache_json()
+        except orjson.JSONDecodeError:
+            pass  # Legacy file the stdlib accepts but orjson rejects (e.g. NaN)
+
+    # JSON is UTF-8, so hand the raw bytes straight to the parser
+    return json.loads(CACHE_FILE.read_bytes())
 
 
 def save_cache(cache: dict):
-    """Save the narration cache file."""
+    """Save the narration cache file atomically."""
     CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(CACHE_FILE, "w") as f:
-        json.dump(cache, f, indent=2)
+    if orjson is not None:
+        data = orjson.dumps(cache, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    else:
+        data = json.dumps(cache, indent=2, sort_keys=True).encode()
+
+    # Write to a uniquely named temp file and rename it over the cache, so
+    # concurrent runs and crashes can never leave a partial or empty file
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_FILE.parent, prefix=CACHE_FILE.name)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, CACHE_FILE)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def hash_bytes(data: bytes) -> str:
+    """Hash data to a compact 22-char URL-safe base64 digest."""
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
 
 
 def hash_text(text: str) -> str:
-    """Generate a hash of the narration text for cache checking."""
-    return hashlib.md5(text.encode()).hexdigest()
+    """Generate a hash of the narration text for cache checking.
+
+    Entries hashed by an older algorithm or encoding simply fail the
+    comparison and are regenerated once.
+    """
+    return hash_bytes(text.encode("utf-8"))
+
+
+def narration_hash(narration: dict) -> str:
+    """Hash a narration's text once, storing the digest on the narration dict.
+
+    Cache checks, dedupe and cache writes (including in pool workers)
+    all reuse it instead of re-encoding and re-hashing the text.
+    """
+    if "hash" not in narration:
+        narration["hash"] = hash_text(narration["text"])
+    return narration["hash"]
 
 
 def get_audio_duration(file_path: Path) -> float:
-    """Get audio duration in seconds using ffprobe."""
+    """Get audio duration in seconds from the WAV header, falling back to ffprobe."""
+    try:
+        with wave.open(str(file_path), "rb") as w:
+            return w.getnframes() / w.getframerate()
+    except (wave.Error, EOFError):
+        pass
+    except OSError:
+        return 0.0
+
     try:
         result = subprocess.run(
             [
@@ -81,6 +191,67 @@ def get_audio_duration(file_path: Path) -> float:
         return 0.0
 
 
+def find_phrase_positions(lower_narration: str, phrases: set[str]) -> dict[str, list[int]]:
+    """
+    Find every start offset of each (lowercase) phrase in the narration.
+
+    Uses a single Aho-Corasick pass when pyahocorasick is installed,
+    otherwise one regex scan per phrase.
+    """
+    positions = {phrase: [] for phrase in phrases}
+    words = [phrase for phrase in phrases if phrase]
+
+    if ahocorasick is not None and words:
+        automaton = ahocorasick.Automaton()
+        for phrase in words:
+            automaton.add_word(phrase, phrase)
+        automaton.make_automaton()
+        for end, phrase in automaton.iter(lower_narration):
+            positions[phrase].append(end - len(phrase) + 1)
+    else:
+        for phrase in words:
+            # Lookahead keeps overlapping matches, as a str.find restart loop would
+            positions[phrase] = [m.start() for m in re.finditer(f"(?={re.escape(phrase)})", lower_narration)]
+
+    # An empty phrase matches at every offset, as str.find would
+    if "" in positions:
+        positions[""] = list(range(len(lower_narration) + 1))
+
+    return positions
+
+
+def _fill_cue_timestamps(positions, timestamps, chars_per_second: float, audio_duration: float,
+                         interactive_count: int):
+    """
+    Fill in a timestamp per cue point.
+
+    Matched cue points sit at their character offset divided by the
+    speaking rate; estimated ones (offset -1) are spread across the
+    middle of the clip by their order.
+    """
+    for k in range(len(positions)):
+        if positions[k] >= 0:
+            timestamps[k] = positions[k] / chars_per_second
+        else:
+            position = k / max(interactive_count, 1)
+            timestamps[k] = (audio_duration * 0.3) + (position * audio_duration * 0.5)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_jit_kernel():
+    """
+    Compile _fill_cue_timestamps with Numba on first use, or None if unavailable.
+
+    Imported lazily so runs that never reach JIT_MIN_CUE_POINTS (cached
+    runs, --compile, pool workers) don't pay for loading numba.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True)(_fill_cue_timestamps)
+
+
 def calculate_cue_points(narration_text: str, audio_duration: float, actions: list) -> list:
     """
     Calculate cue points for actions based on their position in narration text.
@@ -94,87 +265,143 @@ def calculate_cue_points(narration_text: str, audio_duration: float, actions: li
         return []
 
     chars_per_second = len(narration_text) / audio_duration
-    cue_points = []
-    used_positions = []
+    lower_narration = narration_text.lower()
 
+    # Build candidate phrases per action, in priority order
+    candidates = []
     for i, action in enumerate(actions):
         action_type = action.get("type", "")
-        if action_type not in ["click", "fill"]:
+        if action_type not in _INTERACTIVE_TYPES:
             continue
 
         selector = action.get("selector", "")
         # Extract text from selector (e.g., "text=Upsell Wine" -> "Upsell Wine")
-        selector_text = re.sub(r'^text=', '', selector).strip('"\'')
+        selector_text = (selector[5:] if selector.startswith("text=") else selector).strip('"\'')
 
-        # Generate phrases that might describe this action
+        # Generate phrases that might describe this action, with lowercase
+        # copies built alongside (templates are already lowercase)
         phrases = []
+        phrases_lower = []
         if action_type == "click":
-            phrases = [
-                f"taps the {selector_text}",
-                f"clicks the {selector_text}",
-                f"taps {selector_text}",
-                f"clicks {selector_text}",
-                f"click the {selector_text}",
-                f"tap the {selector_text}",
-                selector_text.lower()
-            ]
+            sel_low = selector_text.lower()
+            phrases = [t.format(selector_text) for t in _CLICK_TEMPLATES] + [sel_low]
+            phrases_lower = [t.format(sel_low) for t in _CLICK_TEMPLATES] + [sel_low]
             # Handle confirmation patterns
-            if "again" in selector_text.lower() or "confirm" in selector_text.lower():
-                phrases = [
-                    "confirms with a second tap",
-                    "confirms the action",
-                    "taps again",
-                    "second tap"
-                ] + phrases
-
-        # Find phrase in narration
-        lower_narration = narration_text.lower()
+            if "again" in sel_low or "confirm" in sel_low:
+                phrases = list(_CONFIRM_PHRASES) + phrases
+                phrases_lower = list(_CONFIRM_PHRASES) + phrases_lower
+
+        candidates.append((i, action_type, selector, list(zip(phrases, phrases_lower))))
+
+    # Locate every phrase in one pass over the narration
+    positions = find_phrase_positions(
+        lower_narration,
+        {phrase_lower for *_, phrases in candidates for _, phrase_lower in phrases}
+    )
+
+    # Resolve matches greedily in action order, preferring higher-priority phrases
+    cue_points = []
+    cue_positions = []  # Character offset per cue point, -1 when estimated
+    used_positions = set()
+
+    for i, action_type, selector, phrases in candidates:
         found = False
 
-        for phrase in phrases:
-            pos = lower_narration.find(phrase.lower())
-            # Skip if position already used
-            while pos >= 0 and pos in used_positions:
-                pos = lower_narration.find(phrase.lower(), pos + 1)
+        for phrase, phrase_lower in phrases:
+            # Skip positions already used by an earlier action
+            pos = next((p for p in positions[phrase_lower] if p not in used_positions), -1)
 
             if pos >= 0:
-                timestamp = pos / chars_per_second
                 cue_points.append({
-                    "timestamp": round(timestamp, 2),
+                    "timestamp": 0.0,
                     "actionIndex": i,
                     "phrase": phrase,
                     "selector": selector,
                     "type": action_type
                 })
-                used_positions.append(pos)
+                cue_positions.append(pos)
+                used_positions.add(pos)
                 found = True
                 break
 
         # Fallback: estimate based on action order
         if not found and selector:
-            interactive_count = len([a for a in actions if a.get("type") in ["click", "fill"]])
-            position = len(cue_points) / max(interactive_count, 1)
-            estimated = (audio_duration * 0.3) + (position * audio_duration * 0.5)
             cue_points.append({
-                "timestamp": round(estimated, 2),
+                "timestamp": 0.0,
                 "actionIndex": i,
                 "phrase": f"[estimated: {selector}]",
                 "selector": selector,
                 "type": action_type
             })
+            cue_positions.append(-1)
+
+    # Convert character offsets (or action order) to timestamps
+    kernel = _get_jit_kernel() if len(cue_positions) >= JIT_MIN_CUE_POINTS else None
+    if kernel is not None:
+        import numpy as np
+
+        timestamps = np.empty(len(cue_positions), dtype=np.float64)
+        kernel(
+            np.array(cue_positions, dtype=np.int64), timestamps,
+            chars_per_second, audio_duration, len(candidates)
+        )
+    else:
+        timestamps = [0.0] * len(cue_positions)
+        _fill_cue_timestamps(cue_positions, timestamps, chars_per_second, audio_duration, len(candidates))
+
+    for cue_point, timestamp in zip(cue_points, timestamps):
+        cue_point["timestamp"] = round(float(timestamp), 2)
 
     # Sort by timestamp
     return sorted(cue_points, key=lambda c: c["timestamp"])
 
 
+def _load_compiled_spec(spec_name: str, mtime: int) -> dict | None:
+    """Load a compiled spec if its pickle matches the YAML source mtime."""
+    try:
+        with open(COMPILED_SPECS_DIR / f"{spec_name}.pkl", "rb") as f:
+            compiled = pickle.load(f)
+        if compiled["mtime"] == mtime:
+            return compiled["spec"]
+    except Exception:
+        pass
+    return None
+
+
+def _compile_spec(spec_path: Path, mtime: int) -> dict:
+    """Parse a YAML spec and write it to the compiled pickle cache."""
+    with open(spec_path, "r") as f:
+        spec = yaml.load(f, Loader=SafeLoader)
+
+    COMPILED_SPECS_DIR.mkdir(parents=True, exist_ok=True)
+    with open(COMPILED_SPECS_DIR / f"{spec_path.stem}.pkl", "wb") as f:
+        pickle.dump({"mtime": mtime, "spec": spec}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return spec
+
+
+def _compile_specs() -> int:
+    """Precompile every YAML spec whose pickle is missing or stale."""
+    compiled = 0
+    for spec_name in get_all_specs():
+        spec_path = SPECS_DIR / f"{spec_name}.yaml"
+        mtime = spec_path.stat().st_mtime_ns
+        if _load_compiled_spec(spec_name, mtime) is None:
+            _compile_spec(spec_path, mtime)
+            compiled += 1
+    return compiled
+
+
 def load_spec(spec_name: str) -> dict:
-    """Load a YAML flow specification."""
+    """Load a YAML flow specification, using the compiled pickle when fresh."""
     spec_path = SPECS_DIR / f"{spec_name}.yaml"
     if not spec_path.exists():
         raise FileNotFoundError(f"Spec not found: {spec_path}")
 
-    with open(spec_path, "r") as f:
-        return yaml.safe_load(f)
+    mtime = spec_path.stat().st_mtime_ns
+    spec = _load_compiled_spec(spec_name, mtime)
+    if spec is None:
+        spec = _compile_spec(spec_path, mtime)
+    return spec
 
 
 def extract_narrations(spec: dict) -> list[dict]:
@@ -222,81 +449,313 @@ def extract_narrations(spec: dict) -> list[dict]:
     return narrations
 
 
-def generate_narration_audio(narration: dict, output_dir: Path, cache: dict) -> bool:
-    """Generate audio for a single narration, using cache when possible."""
-    text = narration["text"]
-    text_hash = hash_text(text)
-    narration_id = narration["id"]
-    actions = narration.get("actions", [])
+def list_audio_files(output_dir: Path) -> set[str]:
+    """List the file names in a flow's audio directory with a single scandir."""
+    try:
+        with os.scandir(output_dir) as it:
+            return {e.name for e in it}
+    except FileNotFoundError:
+        return set()
+
+
+def is_cached(narration: dict, output_dir: Path, existing_files: set[str], cache: dict) -> bool:
+    """Check whether a narration's audio and cue points are already cached."""
+    entry = cache.get(narration["id"])
+    if entry is None:
+        return False
 
     # Check cache - also verify cue points exist if there are actions
-    if narration_id in cache and cache[narration_id]["hash"] == text_hash:
-        output_file = Path(cache[narration_id]["file"])
-        cached_has_cue_points = "cuePoints" in cache[narration_id]
-        needs_cue_points = len(actions) > 0 and any(a.get("type") in ["click", "fill"] for a in actions)
+    actions = narration.get("actions", [])
+    needs_cue_points = len(actions) > 0 and any(a.get("type") in _INTERACTIVE_TYPES for a in actions)
+    if needs_cue_points and "cuePoints" not in entry:
+        return False
 
-        if output_file.exists() and (not needs_cue_points or cached_has_cue_points):
-            print(f"  [cached] {narration_id}")
-            return False
+    # Files in the flow's own directory are checked against the scandir listing
+    output_file = Path(entry["file"])
+    if output_file.parent == output_dir:
+        file_exists = output_file.name in existing_files
+    else:
+        file_exists = output_file.exists()
 
-    # Generate audio
-    output_dir.mkdir(parents=True, exist_ok=True)
+    # Hash last - only worth computing once the cheaper checks pass
+    return file_exists and entry["hash"] == narration_hash(narration)
+
+
+def find_pending_narrations(narrations: list[dict], output_dir: Path, cache: dict) -> list[dict]:
+    """Return the narrations that need (re)generating, reporting the cached ones."""
+    existing_files = list_audio_files(output_dir)
+    pending = []
+    for narration in narrations:
+        if is_cached(narration, output_dir, existing_files, cache):
+            print(f"  [cached] {narration['id']}")
+        else:
+            pending.append(narration)
+    return pending
+
+
+def get_output_file(narration_id: str, output_dir: Path) -> Path:
+    """Get the WAV path for a narration (keeps MLX-Audio's _000 suffix)."""
     file_prefix = narration_id.replace("/", "-")
-    output_path = output_dir / f"{file_prefix}.wav"
+    return output_dir / f"{file_prefix}_000.wav"
 
-    # Find actual output file (MLX-Audio appends _000)
-    actual_output = output_dir / f"{file_prefix}_000.wav"
 
-    print(f"  [generating] {narration_id}: \"{text[:50]}...\"" if len(text) > 50 else f"  [generating] {narration_id}: \"{text}\"")
+def get_tts_model():
+    """Load the TTS model once per process and reuse it for every narration."""
+    global _TTS_MODEL
+    if _TTS_MODEL is None:
+        # Imported here so each pool worker initializes its own Metal context
+        from mlx_audio.tts.utils import load_model
+        _TTS_MODEL = load_model(TTS_MODEL)
+    return _TTS_MODEL
 
+
+def write_wav(file_path: Path, segments: list):
+    """Join generated audio segments and write them as 16-bit mono PCM."""
+    import numpy as np
+
+    audio = np.concatenate([np.asarray(segment.audio, dtype=np.float32) for segment in segments])
+    pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype("<i2")
+    with wave.open(str(file_path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(segments[0].sample_rate)
+        w.writeframes(pcm.tobytes())
+
+
+def synthesize_narration(narration: dict, output_dir: Path) -> dict:
+    """
+    Synthesize a narration to WAV and build its cache entry.
+
+    Duration is read from the WAV header in-process and cue points are
+    computed straight away, so the caller only has to store the entry.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_file = get_output_file(narration["id"], output_dir)
+
+    # Call the model directly - generate_audio() reloads weights on every call
+    segments = list(get_tts_model().generate(
+        text=narration["text"],
+        voice=TTS_VOICE,
+        speed=TTS_SPEED,
+        lang_code=TTS_LANG
+    ))
+
+    # Unlink first - the old file may be a hard link shared with another narration
+    output_file.unlink(missing_ok=True)
+    write_wav(output_file, segments)
+
+    return build_cache_entry(narration, output_file)
+
+
+def build_cache_entry(narration: dict, output_file: Path) -> dict:
+    """Build a narration's cache entry from its audio file."""
+    text = narration["text"]
+    actions = narration.get("actions", [])
+    duration = get_audio_duration(output_file)
+
+    # Calculate cue points for step narrations with actions
+    cue_points = []
+    if actions and duration > 0:
+        cue_points = calculate_cue_points(text, duration, actions)
+
+    return {
+        "hash": narration_hash(narration),
+        "file": str(output_file),
+        "text": text,
+        "duration": round(duration, 3),
+        "role": narration.get("role"),
+        "step": narration.get("step"),
+        "type": narration.get("type"),
+        "cuePoints": cue_points
+    }
+
+
+def build_audio_index(cache: dict) -> dict[str, str]:
+    """Map each cached text hash to its audio file, so identical texts share audio."""
+    return {entry["hash"]: entry["file"] for key, entry in cache.items() if key != SPECS_CACHE_KEY}
+
+
+def link_audio(source: Path, target: Path):
+    """
+    Hard-link existing audio into place, copying it where linking fails.
+
+    A symlink is never used: regenerating the source writes a new file at
+    the same path, which a symlink would follow.
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.unlink(missing_ok=True)
     try:
-        generate_audio(
-            text=text,
-            model_path=TTS_MODEL,
-            voice=TTS_VOICE,
-            speed=TTS_SPEED,
-            lang_code=TTS_LANG,
-            file_prefix=str(output_dir / file_prefix),
-            audio_format="wav",
-            sample_rate=24000,
-            verbose=False
-        )
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+
+
+def reuse_audio(narration: dict, text_hash: str, output_dir: Path, audio_index: dict[str, str], cache: dict) -> bool:
+    """Reuse audio already synthesized for identical text instead of regenerating it."""
+    source = audio_index.get(text_hash)
+    if source is None or not Path(source).exists():
+        return False
 
-        # Get audio duration
-        duration = get_audio_duration(actual_output)
-
-        # Calculate cue points for step narrations with actions
-        cue_points = []
-        if actions and duration > 0:
-            cue_points = calculate_cue_points(text, duration, actions)
-            if cue_points:
-                print(f"    [cue points] {len(cue_points)} action(s) timed:")
-                for cp in cue_points:
-                    print(f"      [{cp['timestamp']:.2f}s] {cp['type']}: {cp['phrase']}")
-
-        # Update cache with all metadata
-        cache[narration_id] = {
-            "hash": text_hash,
-            "file": str(actual_output),
-            "text": text,
-            "duration": round(duration, 3),
-            "role": narration.get("role"),
-            "step": narration.get("step"),
-            "type": narration.get("type"),
-            "cuePoints": cue_points
-        }
-        return True
+    narration_id = narration["id"]
+    output_file = get_output_file(narration_id, output_dir)
+    if Path(source) != output_file:
+        link_audio(Path(source), output_file)
+
+    # Cue points depend on this narration's own actions, so rebuild the entry
+    cache[narration_id] = build_cache_entry(narration, output_file)
+    print(f"  [reused] {narration_id} <- {Path(source).name}")
+    return True
+
+
+def _worker(narration: dict, output_dir_str: str) -> tuple[str, dict]:
+    """Process pool entry point - synthesizes one narration in a worker process."""
+    return narration["id"], synthesize_narration(narration, Path(output_dir_str))
+
+
+def print_generating(narration: dict):
+    """Print a progress line for a narration about to be synthesized."""
+    narration_id = narration["id"]
+    text = narration["text"]
+    print(f"  [generating] {narration_id}: \"{text[:50]}...\"" if len(text) > 50 else f"  [generating] {narration_id}: \"{text}\"")
+
+
+def print_cue_points(narration_id: str, entry: dict):
+    """Print the cue points calculated for a freshly generated narration."""
+    cue_points = entry["cuePoints"]
+    if cue_points:
+        print(f"    [cue points] {narration_id}: {len(cue_points)} action(s) timed:")
+        for cp in cue_points:
+            print(f"      [{cp['timestamp']:.2f}s] {cp['type']}: {cp['phrase']}")
+
+
+def generate_narration_audio(narration: dict, output_dir: Path, cache: dict) -> bool:
+    """Generate audio for a single narration, returning whether it succeeded."""
+    narration_id = narration["id"]
+    print_generating(narration)
+
+    try:
+        cache[narration_id] = synthesize_narration(narration, output_dir)
     except Exception as e:
         print(f"  [error] {narration_id}: {e}")
         return False
 
+    print_cue_points(narration_id, cache[narration_id])
+    return True
+
+
+def generate_narrations_parallel(narrations: list[dict], output_dir: Path, cache: dict,
+                                 executor: ProcessPoolExecutor) -> int:
+    """
+    Generate narrations concurrently, merging results into the cache.
+
+    If a worker process dies the pool is unusable: narrations that already
+    finished are still stored, then BrokenProcessPool is re-raised so the
+    caller can redo the rest without the pool.
+    """
+    futures = {}
+    broken = None
+    for narration in narrations:
+        try:
+            future = executor.submit(_worker, narration, str(output_dir))
+        except BrokenProcessPool as e:
+            broken = e
+            break
+        print_generating(narration)
+        futures[future] = narration["id"]
+
+    generated = 0
+    for future in as_completed(futures):
+        try:
+            narration_id, entry = future.result()
+        except BrokenProcessPool as e:
+            broken = e
+            continue
+        except Exception as e:
+            print(f"  [error] {futures[future]}: {e}")
+            continue
+        cache[narration_id] = entry
+        print_cue_points(narration_id, entry)
+        generated += 1
+
+    if broken is not None:
+        raise broken
+    return generated
+
+
+def hash_file(file_path: Path) -> str:
+    """Generate a hash of a spec file's contents."""
+    return hash_bytes(file_path.read_bytes())
+
+
+def is_spec_cached(spec_name: str, spec_path: Path, cache: dict) -> bool:
+    """Check whether a spec is unchanged and its narrations are still cached as it left them."""
+    entry = cache.get(SPECS_CACHE_KEY, {}).get(spec_name)
+    if not entry or "narrations" not in entry:
+        return False
+
+    mtime = spec_path.stat().st_mtime_ns
+    if entry["mtime"] != mtime:
+        # Touched but not edited - refresh the mtime and keep the entry
+        if entry["sha"] != hash_file(spec_path):
+            return False
+        entry["mtime"] = mtime
+
+    # Another spec with the same flow id may have overwritten these entries since
+    for narration_id, text_hash in entry["narrations"].items():
+        narration_entry = cache.get(narration_id)
+        if (not narration_entry or narration_entry["hash"] != text_hash
+                or not Path(narration_entry["file"]).exists()):
+            return False
+    return True
+
+
+def record_spec(spec_name: str, spec_path: Path, narrations: list[dict], cache: dict):
+    """Record a spec as fully generated so later runs can skip it."""
+    specs = cache.setdefault(SPECS_CACHE_KEY, {})
+
+    # Only record specs whose narrations all made it into the cache
+    for narration in narrations:
+        entry = cache.get(narration["id"])
+        if not entry or entry["hash"] != narration_hash(narration):
+            specs.pop(spec_name, None)
+            return
+
+    specs[spec_name] = {
+        "mtime": spec_path.stat().st_mtime_ns,
+        "sha": hash_file(spec_path),
+        "narrations": {n["id"]: narration_hash(n) for n in narrations}
+    }
+
+
+def prepare_spec(spec_name: str) -> tuple[dict, list[dict]]:
+    """Load a spec and extract its narrations."""
+    spec = load_spec(spec_name)
+    return spec, extract_narrations(spec)
 
-def process_spec(spec_name: str, cache: dict) -> tuple[int, int]:
+
+def prefetch_spec(prefetcher: ThreadPoolExecutor, spec_name: str, cache: dict) -> Future | None:
+    """Start preparing a spec in the background unless it will be skipped as cached."""
+    spec_path = SPECS_DIR / f"{spec_name}.yaml"
+    if spec_path.exists() and is_spec_cached(spec_name, spec_path, cache):
+        return None
+    return prefetcher.submit(prepare_spec, spec_name)
+
+
+def process_spec(spec_name: str, cache: dict, executor: ProcessPoolExecutor | None = None,
+                 prepared: Future | None = None) -> tuple[int, int]:
     """Process a single spec file and generate narrations."""
     print(f"\nProcessing: {spec_name}")
 
-    spec = load_spec(spec_name)
-    narrations = extract_narrations(spec)
+    spec_path = SPECS_DIR / f"{spec_name}.yaml"
+    if spec_path.exists() and is_spec_cached(spec_name, spec_path, cache):
+        spec_narrations = cache[SPECS_CACHE_KEY][spec_name]["narrations"]
+        print(f"  [spec cached] {len(spec_narrations)} narration(s)")
+        return 0, len(spec_narrations)
+
+    if prepared is not None:
+        spec, narrations = prepared.result()
+    else:
+        spec, narrations = prepare_spec(spec_name)
 
     if not narrations:
         print("  No narrations found in spec")
@@ -305,39 +764,88 @@ def process_spec(spec_name: str, cache: dict) -> tuple[int, int]:
     flow_id = spec["flow"]["id"]
     output_dir = AUDIO_DIR / flow_id
 
-    generated = 0
-    cached = 0
+    pending = find_pending_narrations(narrations, output_dir, cache)
 
-    for narration in narrations:
-        if generate_narration_audio(narration, output_dir, cache):
-            generated += 1
+    # Only synthesize each distinct text once; identical texts link to its audio
+    audio_index = build_audio_index(cache)
+    to_generate = []
+    duplicates = []
+    queued_hashes = set()
+    for narration in pending:
+        text_hash = narration_hash(narration)
+        if reuse_audio(narration, text_hash, output_dir, audio_index, cache):
+            continue
+        if text_hash in queued_hashes:
+            duplicates.append((narration, text_hash))
         else:
-            cached += 1
+            queued_hashes.add(text_hash)
+            to_generate.append(narration)
 
+    if executor is not None:
+        generated = generate_narrations_parallel(to_generate, output_dir, cache, executor)
+    else:
+        generated = 0
+        for narration in to_generate:
+            if generate_narration_audio(narration, output_dir, cache):
+                generated += 1
+
+    audio_index = build_audio_index(cache)
+    for narration, text_hash in duplicates:
+        if not reuse_audio(narration, text_hash, output_dir, audio_index, cache):
+            print(f"  [error] {narration['id']}: audio for identical text was not generated")
+
+    cached = len(narrations) - generated
+    record_spec(spec_name, spec_path, narrations, cache)
     return generated, cached
 
 
 def get_all_specs() -> list[str]:
     """Get all YAML spec names."""
-    specs = []
-    for file in SPECS_DIR.glob("*.yaml"):
-        specs.append(file.stem)
-    return sorted(specs)
+    # DirEntry caches the file type from readdir, so no extra stat per entry
+    with os.scandir(SPECS_DIR) as it:
+        return sorted(
+            e.name[:-5] for e in it
+            if e.is_file(follow_symlinks=False) and e.name.endswith(".yaml")
+        )
+
+
+def parse_threads(args: list[str]) -> int:
+    """Pop `--threads N` from args, returning the worker count."""
+    if "--threads" not in args:
+        return DEFAULT_WORKERS
+
+    idx = args.index("--threads")
+    try:
+        threads = int(args[idx + 1])
+    except (IndexError, ValueError):
+        print("Error: --threads requires an integer")
+        sys.exit(1)
+    del args[idx:idx + 2]
+    return max(threads, 1)
 
 
 def main():
     args = sys.argv[1:]
+    threads = parse_threads(args)
 
     if not args:
         print("Usage:")
-        print("  python e2e/scripts/generate-narration.py <spec-name>")
-        print("  python e2e/scripts/generate-narration.py --all")
+        print("  python e2e/scripts/generate-narration.py <spec-name> [--threads N]")
+        print("  python e2e/scripts/generate-narration.py --all [--threads N]")
+        print("  python e2e/scripts/generate-narration.py --compile")
+        print()
+        print(f"  --threads N   Parallel TTS worker processes (default {DEFAULT_WORKERS}, 1 = sequential)")
         print()
         print("Available specs:")
         for spec in get_all_specs():
             print(f"  - {spec}")
         sys.exit(1)
 
+    if args[0] == "--compile":
+        compiled = _compile_specs()
+        print(f"Compiled {compiled} spec(s) to {COMPILED_SPECS_DIR}")
+        return
+
     cache = load_cache()
     total_generated = 0
     total_cached = 0
@@ -348,16 +856,44 @@ def main():
     else:
         specs = [args[0]]
 
-    for spec_name in specs:
-        try:
-            generated, cached = process_spec(spec_name, cache)
-            total_generated += generated
-            total_cached += cached
-        except FileNotFoundError as e:
-            print(f"Error: {e}")
-            sys.exit(1)
-
-    save_cache(cache)
+    executor = ProcessPoolExecutor(max_workers=threads) if threads > 1 else None
+    # Parses the next spec's YAML while the current one is synthesizing
+    prefetcher = ThreadPoolExecutor(max_workers=1) if len(specs) > 1 else None
+
+    try:
+        prepared = None
+        for i, spec_name in enumerate(specs):
+            next_prepared = None
+            if prefetcher is not None and i + 1 < len(specs):
+                next_prepared = prefetch_spec(prefetcher, specs[i + 1], cache)
+
+            try:
+                try:
+                    generated, cached = process_spec(spec_name, cache, executor, prepared)
+                except BrokenProcessPool:
+                    # A worker died (e.g. memory pressure or a native abort). Finished
+                    # narrations are already cached; redo the rest sequentially.
+                    print("  [error] TTS worker process died - continuing sequentially")
+                    executor.shutdown(wait=False)
+                    executor = None
+                    generated, cached = process_spec(spec_name, cache, None, prepared)
+                total_generated += generated
+                total_cached += cached
+            except FileNotFoundError as e:
+                print(f"Error: {e}")
+                sys.exit(1)
+
+            # Persist progress per spec so a later failure can't discard it
+            if generated:
+                save_cache(cache)
+
+            prepared = next_prepared
+    finally:
+        if prefetcher is not None:
+            prefetcher.shutdown()
+        if executor is not None:
+            executor.shutdown()
+        save_cache(cache)
 
     print()
     print(f"Done! Generated: {total_generated}, Cached: {total_cached}")